@@ -2,8 +2,6 @@ from __future__ import annotations
 
 import typing
 
-from ietfparse import headers
-
 if typing.TYPE_CHECKING:
     from collections import abc
 
@@ -28,9 +26,16 @@ class ParameterParser:
 
     """
 
+    _RFC_PARAMETERS = frozenset({'rel', 'media', 'type', 'title', 'title*'})
+
     def __init__(self, *, strict: bool = True) -> None:
         self.strict = strict
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard the parsed values so the parser can be reused."""
         self._values: list[tuple[str, str]] = []
+        self._parsed: tuple[tuple[str, str], ...] | None = None
         self._rfc_values: dict[str, str | None] = {
             'rel': None,
             'media': None,
@@ -55,13 +60,12 @@ class ParameterParser:
         only values that are acceptable will be added to ``_values``.
 
         """
-        try:
+        self._parsed = None
+        if name in self._RFC_PARAMETERS:
             if self._rfc_values[name] is None:
                 self._rfc_values[name] = value
             elif self.strict:
                 return
-        except KeyError:
-            pass
 
         if self.strict and name in ('title', 'title*'):
             return
@@ -69,8 +73,15 @@ class ParameterParser:
         self._values.append((name, value))
 
     @property
-    def values(self) -> list[tuple[str, str]]:
-        """The name/value mapping that was parsed."""
+    def values(self) -> tuple[tuple[str, str], ...]:
+        """The name/value mapping that was parsed.
+
+        The result is retained until the next call to `add_value`
+        or `reset` so repeated access does not rebuild it.
+        """
+        if self._parsed is not None:
+            return self._parsed
+
         values = self._values[:]
         if self.strict:
             preferred_title = self._rfc_values['title*']
@@ -81,7 +92,11 @@ class ParameterParser:
                     values.append(('title', preferred_title))
             elif fallback_title is not None:
                 values.append(('title', fallback_title))
-        return values
+        self._parsed = tuple(values)
+        return self._parsed
+
+
+_PARSERS: dict[str, abc.Callable[[str], object]] = {}
 
 
 @typing.overload
@@ -103,9 +118,20 @@ def parse_header(
 
 
 def parse_header(parser_name: str, value: str) -> object:
+    if not _PARSERS:
+        # imported here so that using the data structures does not
+        # require loading the header parsers
+        from ietfparse import headers
+
+        _PARSERS['parse_accept'] = headers.parse_accept
+        _PARSERS['parse_content_type'] = headers.parse_content_type
+        _PARSERS['parse_link'] = headers.parse_link
+
     try:
-        return getattr(headers, parser_name)(value)
-    except AttributeError:
+        parser = _PARSERS[parser_name]
+    except KeyError:
         raise NotImplementedError(f'unknown parser {parser_name}') from None
+    try:
+        return parser(value)
     except ValueError:
         return value
@@ -144,10 +144,8 @@ def select_content_type(  # noqa: C901 -- overly complex
             return _default, _default
         raise errors.NoMatch
 
-    matches = sorted(
-        matches, key=attrgetter('match_type', 'parameter_distance')
-    )
-    return matches[0].candidate, matches[0].pattern
+    best = min(matches, key=attrgetter('match_type', 'parameter_distance'))
+    return best.candidate, best.pattern
 
 
 def _normalize_parameters(
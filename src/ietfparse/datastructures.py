@@ -12,7 +12,6 @@ fully fleshed out and ends up here.
 
 from __future__ import annotations
 
-import collections
 import functools
 import typing
 from collections import abc
@@ -20,7 +19,6 @@ from collections import abc
 from ietfparse import _helpers
 
 
-@functools.total_ordering
 class ContentType:
     """A MIME ``Content-Type`` header.
 
@@ -50,6 +48,15 @@ class ContentType:
 
     """
 
+    __slots__ = (
+        '__weakref__',
+        'content_subtype',
+        'content_suffix',
+        'content_type',
+        'parameters',
+        'quality',
+    )
+
     content_type: str
     content_subtype: str
     parameters: abc.MutableMapping[str, str]
@@ -70,10 +77,37 @@ class ContentType:
             self.content_suffix = content_suffix.strip().lower()
         else:
             self.content_suffix = None
-        self.parameters = {}
-        if parameters is not None:
-            for name in parameters:
-                self.parameters[name.lower()] = str(parameters[name])
+        if parameters is None:
+            self.parameters = {}
+        else:
+            self.parameters = {
+                name.lower(): value if isinstance(value, str) else str(value)
+                for name, value in parameters.items()
+            }
+
+    @classmethod
+    def _from_parsed(
+        cls,
+        content_type: str,
+        content_subtype: str,
+        parameters: dict[str, str],
+        content_suffix: str | None,
+    ) -> ContentType:
+        """Create an instance from normalized components.
+
+        This skips the normalization performed by ``__init__`` and
+        takes ownership of `parameters`.  It is only meant to be used
+        by the header parsers which have already normalized the
+        components.
+
+        """
+        instance = cls.__new__(cls)
+        instance.content_type = content_type
+        instance.content_subtype = content_subtype
+        instance.content_suffix = content_suffix
+        instance.parameters = parameters
+        instance.quality = None
+        return instance
 
     def __str__(self) -> str:
         suffix, params = '', ''
@@ -81,8 +115,8 @@ class ContentType:
             suffix = f'+{self.content_suffix}'
         if self.parameters:
             params = '; '.join(
-                f'{name}={self.parameters[name]}'
-                for name in sorted(self.parameters)
+                f'{name}={value}'
+                for name, value in sorted(self.parameters.items())
             )
             params = f'; {params}'
         return f'{self.content_type}/{self.content_subtype}{suffix}{params}'
@@ -103,10 +137,40 @@ class ContentType:
         )
 
     def __eq__(self, other: object) -> bool:
-        if isinstance(other, str):
-            other = _helpers.parse_header('parse_content_type', other)
-        if not isinstance(other, ContentType):
+        if other is self:
+            return True
+        other_type = _as_content_type(other)
+        if other_type is None:
+            return NotImplemented
+        return self._is_equal_to(other_type)
+
+    def __lt__(self, other: object) -> bool:
+        other_type = _as_content_type(other)
+        if other_type is None:
             return NotImplemented
+        return self._is_less_than(other_type)
+
+    def __le__(self, other: object) -> bool:
+        other_type = _as_content_type(other)
+        if other_type is None:
+            return NotImplemented
+        return self._is_less_than(other_type) or self._is_equal_to(other_type)
+
+    def __gt__(self, other: object) -> bool:
+        other_type = _as_content_type(other)
+        if other_type is None:
+            return NotImplemented
+        return not (
+            self._is_less_than(other_type) or self._is_equal_to(other_type)
+        )
+
+    def __ge__(self, other: object) -> bool:
+        other_type = _as_content_type(other)
+        if other_type is None:
+            return NotImplemented
+        return not self._is_less_than(other_type)
+
+    def _is_equal_to(self, other: ContentType) -> bool:
         return (
             self.content_type == other.content_type
             and self.content_subtype == other.content_subtype
@@ -114,11 +178,7 @@ class ContentType:
             and self.parameters == other.parameters
         )
 
-    def __lt__(self, other: object) -> bool:
-        if isinstance(other, str):
-            other = _helpers.parse_header('parse_content_type', other)
-        if not isinstance(other, ContentType):
-            return NotImplemented
+    def _is_less_than(self, other: ContentType) -> bool:
         if self.content_type == '*' and other.content_type != '*':
             return True
         if self.content_subtype == '*' and other.content_subtype != '*':
@@ -130,12 +190,42 @@ class ContentType:
         return self.content_type < other.content_type
 
 
+def _as_content_type(value: object) -> ContentType | None:
+    """Coerce `value` into a content type for comparison purposes.
+
+    :return: the parsed content type or :data:`None` if `value`
+        cannot be compared to a content type
+
+    Strings are parsed once here so that the comparison operators
+    do not parse the same value repeatedly.
+
+    """
+    if isinstance(value, str):
+        return _parse_comparand(value)
+    return value if isinstance(value, ContentType) else None
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_comparand(value: str) -> ContentType | None:
+    """Parse a string that a content type is being compared with.
+
+    Applications tend to compare against a small set of literals so
+    the parsed instances are cached.  The result is never returned
+    from a comparison so sharing it is safe.
+
+    """
+    parsed = _helpers.parse_header('parse_content_type', value)
+    return parsed if isinstance(parsed, ContentType) else None
+
+
 T = typing.TypeVar('T')
 
 
 class ImmutableSequence(abc.Sequence[T], typing.Generic[T]):
     """Immutable sequence."""
 
+    __slots__ = ('__data', '__weakref__')
+
     def __init__(self, seq: abc.Iterable[T]) -> None:
         self.__data = list(seq)
 
@@ -167,6 +257,10 @@ class ImmutableSequence(abc.Sequence[T], typing.Generic[T]):
         return self.__data.count(value)
 
     def __eq__(self, other: object) -> bool:
+        if isinstance(other, ImmutableSequence):
+            return self.__data == other.__data
+        if isinstance(other, list):
+            return self.__data == other
         try:
             return len(other) == len(self.__data) and all(  # type: ignore[arg-type]
                 a == b
@@ -188,6 +282,9 @@ class ImmutableSequence(abc.Sequence[T], typing.Generic[T]):
         raise TypeError('Cannot modify ImmutableSequence')
 
 
+_EMPTY_SEQUENCE: ImmutableSequence[str] = ImmutableSequence[str](())
+
+
 class LinkHeader:
     """Represents a single link within a `Link` header.
 
@@ -196,16 +293,30 @@ class LinkHeader:
     HTTP resources.
     """
 
+    __slots__ = (
+        '__weakref__',
+        '_formatted',
+        '_parameters',
+        '_params',
+        '_rel',
+        '_sequences',
+        '_target',
+    )
+
     def __init__(
         self,
         target: str,
         parameters: abc.Sequence[tuple[str, str]] | None = None,
     ) -> None:
         self._target = target
-        param_dict = collections.defaultdict(list)
-        for name, value in parameters or []:
-            param_dict[name].append(value)
-        self._params = dict(param_dict.items())
+        self._params: dict[str, list[str]] = {}
+        for name, value in parameters or ():
+            self._params.setdefault(name, []).append(value)
+        # derived values are computed on first use
+        self._formatted: str | None = None
+        self._sequences: dict[str, ImmutableSequence[str]] | None = None
+        self._parameters: ImmutableSequence[tuple[str, str]] | None = None
+        self._rel: str | None = None
 
     @property
     def target(self) -> str:
@@ -217,48 +328,65 @@ class LinkHeader:
         """
         return self._target
 
-    @functools.cached_property
+    @property
     def parameters(self) -> abc.Sequence[tuple[str, str]]:
         """Possibly empty sequence of name and value pairs.
 
         Parameters are represented as a sequence since a single
         parameter may occur more than once.
         """
-        return ImmutableSequence[tuple[str, str]](
-            (item, value)
-            for item, values in self._params.items()
-            for value in values
-        )
+        if self._parameters is None:
+            self._parameters = ImmutableSequence[tuple[str, str]](
+                [
+                    (item, value)
+                    for item, values in self._params.items()
+                    for value in values
+                ]
+            )
+        return self._parameters
 
-    @functools.cached_property
+    @property
     def rel(self) -> str:
         """Space-separated relationship parameter.
 
         This will be the empty string if the `rel` parameter
         was not included.
         """
-        return ' '.join(self._params.get('rel', [])).strip()
+        if self._rel is None:
+            self._rel = ' '.join(self._params.get('rel', [])).strip()
+        return self._rel
 
     def __getitem__(self, param_name: str) -> abc.Sequence[str]:
         """Return the parameter values for `param_name` as a list.
 
         If `param_name` is not present, then an empty sequence is returned.
         """
-        return ImmutableSequence[str](self._params.get(param_name, []))
+        if self._sequences is None:
+            self._sequences = {}
+        values = self._sequences.get(param_name)
+        if values is None:
+            if param_name not in self._params:
+                return _EMPTY_SEQUENCE
+            values = ImmutableSequence[str](self._params[param_name])
+            self._sequences[param_name] = values
+        return values
 
     def __contains__(self, param_name: object) -> bool:
         return param_name in self._params
 
     def __str__(self) -> str:
-        formatted = [f'<{self.target}>']
-        if self.rel:
-            formatted.append(f'rel="{self.rel}"')
-        formatted.extend(
-            sorted(
-                f'{name}="{value}"'
-                for name in self._params
-                for value in self._params[name]
-                if name != 'rel'
+        # instances are immutable so the formatted value is computed once
+        if self._formatted is None:
+            formatted = [f'<{self.target}>']
+            if self.rel:
+                formatted.append(f'rel="{self.rel}"')
+            formatted.extend(
+                sorted(
+                    f'{name}="{value}"'
+                    for name, values in self._params.items()
+                    if name != 'rel'
+                    for value in values
+                )
             )
-        )
-        return '; '.join(formatted)
+            self._formatted = '; '.join(formatted)
+        return self._formatted
@@ -8,41 +8,42 @@
 - :func:`.parse_link`: parse a :rfc:`5988` ``Link`` value
 - :func:`.parse_list`: parse a comma-separated list that is
   present in so many headers
+- :func:`.iter_list`: lazily parse a comma-separated list
 
 """
 
 from __future__ import annotations
 
 import contextlib
-import decimal
 import functools
-import re
 import typing
+from operator import itemgetter
 
 from ietfparse import _helpers, datastructures, errors
 
 if typing.TYPE_CHECKING:
     from collections import abc
 
-_CACHE_CONTROL_BOOL_DIRECTIVES = (
-    'must-revalidate',
-    'no-cache',
-    'no-store',
-    'no-transform',
-    'only-if-cached',
-    'public',
-    'private',
-    'proxy-revalidate',
+_CACHE_CONTROL_BOOL_DIRECTIVES = frozenset(
+    {
+        'must-revalidate',
+        'no-cache',
+        'no-store',
+        'no-transform',
+        'only-if-cached',
+        'public',
+        'private',
+        'proxy-revalidate',
+    }
 )
-_COMMENT_RE = re.compile(r'\(.*\)')
-_QUOTED_SEGMENT_RE = re.compile(r'"([^"]*)"')
-_DEF_PARAM_VALUE = object()
+_FORWARDED_STANDARD_PARAMETERS = frozenset({'by', 'for', 'host', 'proto'})
+_PARSE_CACHE_SIZE = 256
 
 # This is *here* instead of constants.py to avoid a ciecular import
 _SMALLEST_QUALITY = 0.001
 
 
-def parse_accept(  # noqa: C901 -- overly complex
+def parse_accept(
     header_value: str, *, strict: bool = False
 ) -> list[datastructures.ContentType]:
     """Parse an HTTP Accept header.
@@ -75,45 +76,21 @@ def parse_accept(  # noqa: C901 -- overly complex
         value in `header_value` could not be parsed by
         [ietfparse.headers.parse_content_type][]
 
-    """
-    guard: contextlib.AbstractContextManager[None]
-    if strict:
-        guard = contextlib.nullcontext()
-    else:
-        guard = contextlib.suppress(ValueError)
-
-    next_explicit_q = decimal.ExtendedContext.next_plus(decimal.Decimal('5.0'))
-    headers: list[datastructures.ContentType] = []
-    for content_type in parse_list(header_value):
-        with guard:
-            headers.append(parse_content_type(content_type))
-
-    for header in headers:
-        q = header.parameters.pop('q', None)
-        if q is None:
-            header.quality = 1.0
-        elif q == '1.0':
-            header.quality = float(next_explicit_q)
-            next_explicit_q = next_explicit_q.next_minus()
-        else:
-            header.quality = float(q)
-
-    def ordering(
-        left: datastructures.ContentType, right: datastructures.ContentType
-    ) -> int:
-        assert left.quality is not None  # appease mypy  # noqa: S101
-        assert right.quality is not None  # appease mypy  # noqa: S101
-        if left.quality == right.quality:
-            if left == right:
-                return 0
-            if left > right:
-                return -1
-            return 1
-        if left.quality > right.quality:
-            return -1
-        return 1
+    The parsed form of recently seen values is cached.  A new list of
+    new [ietfparse.datastructures.ContentType][] instances is returned
+    from each call so it is safe to modify the result.
 
-    return sorted(headers, key=functools.cmp_to_key(ordering))
+    """
+    result = []
+    for type_name, subtype, parameters, suffix, quality in _parse_accept(
+        header_value, strict=strict
+    ):
+        content_type = datastructures.ContentType._from_parsed(  # noqa: SLF001
+            type_name, subtype, dict(parameters), suffix
+        )
+        content_type.quality = quality
+        result.append(content_type)
+    return result
 
 
 def parse_accept_charset(header_value: str) -> list[str]:
@@ -134,7 +111,7 @@ def parse_accept_charset(header_value: str) -> list[str]:
         priority
 
     """
-    return _parse_qualified_list(header_value)
+    return list(_parse_qualified_list(header_value))
 
 
 def parse_accept_encoding(header_value: str) -> list[str]:
@@ -154,7 +131,7 @@ def parse_accept_encoding(header_value: str) -> list[str]:
     :return: list of encodings sorted from highest to lowest priority
 
     """
-    return _parse_qualified_list(header_value)
+    return list(_parse_qualified_list(header_value))
 
 
 def parse_accept_language(header_value: str) -> list[str]:
@@ -174,7 +151,7 @@ def parse_accept_language(header_value: str) -> list[str]:
     :return: list of languages sorted from highest to lowest priority
 
     """
-    return _parse_qualified_list(header_value)
+    return list(_parse_qualified_list(header_value))
 
 
 def parse_cache_control(
@@ -189,27 +166,11 @@ def parse_cache_control(
     :param header_value: the header value to parse
     :return: the parsed Cache-Control directives
 
-    """
-    directives: dict[str, str | int | bool | None] = {}
-
-    for segment in parse_list(header_value):
-        name, sep, value = segment.partition('=')
-        if sep != '=':
-            directives[name] = None
-        elif sep and value:
-            value = _dequote(value.strip())
-            try:
-                directives[name] = int(value)
-            except ValueError:
-                directives[name] = value
-        # NB ``name='' is never valid and is ignored!
-
-    # convert parameterless boolean directives
-    for name in _CACHE_CONTROL_BOOL_DIRECTIVES:
-        if directives.get(name, '') is None:
-            directives[name] = True
+    The parsed form of recently seen values is cached and a new
+    [dict][] is returned from each call.
 
-    return directives
+    """
+    return dict(_parse_cache_control(header_value))
 
 
 def parse_content_type(
@@ -231,24 +192,17 @@ def parse_content_type(
     :raise ietfparse.errors.MalformedContentType:
         if the content type cannot be parsed (eg, `Content-Type: *`)
 
+    The parsed form of recently seen values is cached since servers
+    tend to receive the same handful of content types over and over.
+    A new [ietfparse.datastructures.ContentType][] is returned from
+    each call so it is safe to modify the result.
+
     """
-    parts = _remove_comments(content_type).split(';')
-    type_spec = parts.pop(0)
-    try:
-        content_type, content_subtype = type_spec.split('/')
-    except ValueError as error:
-        raise errors.MalformedContentType(content_type) from error
-
-    parameters = _parse_parameter_list(
-        parts, normalize_parameter_values=normalize_parameter_values
+    type_name, subtype, parameters, suffix = _parse_content_type(
+        content_type, normalize_parameter_values=normalize_parameter_values
     )
-    if '+' in content_subtype:
-        content_subtype, content_suffix = content_subtype.split('+')
-        return datastructures.ContentType(
-            content_type, content_subtype, dict(parameters), content_suffix
-        )
-    return datastructures.ContentType(
-        content_type, content_subtype, dict(parameters)
+    return datastructures.ContentType._from_parsed(  # noqa: SLF001
+        type_name, subtype, dict(parameters), suffix
     )
 
 
@@ -269,23 +223,33 @@ def parse_forwarded(
     :return: an ordered [list][] of [dict][] instances
     :raises ietfparse.errors.StrictHeaderParsingFailure:
         if `only_standard_parameters` is enabled and a non-standard
-        parameter name is encountered
+        parameter name or a parameter without a value is encountered
+
+    Parameters without a value are not permitted by [RFC-7239].  They
+    are ignored unless `only_standard_parameters` is enabled and
+    elements that do not contain any valid parameters are omitted.
 
     """
     result = []
-    for entry in parse_list(header_value):
+    for entry in iter_list(header_value):
+        parameters = entry.split(';')
+        if only_standard_parameters and any(
+            '=' not in param and param.strip() for param in parameters
+        ):
+            raise errors.StrictHeaderParsingFailure('Forwarded', header_value)
         param_tuples = _parse_parameter_list(
-            entry.split(';'),
+            parameters,
             normalize_parameter_names=True,
             normalize_parameter_values=False,
         )
         if only_standard_parameters:
             for name, _ in param_tuples:
-                if name not in ('for', 'proto', 'by', 'host'):
+                if name not in _FORWARDED_STANDARD_PARAMETERS:
                     raise errors.StrictHeaderParsingFailure(
                         'Forwarded', header_value
                     )
-        result.append(dict(param_tuples))
+        if param_tuples:
+            result.append(dict(param_tuples))
     return result
 
 
@@ -307,60 +271,45 @@ def parse_link(
         if the specified `header_value` cannot be parsed
 
     """
-    sanitized = _remove_comments(header_value)
+    # Each link value is a target in angle brackets followed by an
+    # optional list of parameters that starts with a semicolon.  Link
+    # values are separated by commas that are not quoted.
+    buf = _remove_comments(header_value)
+    if buf and buf.isspace():
+        raise errors.MalformedLinkValue('Malformed link header', buf)
+    buf = buf.strip()
     links = []
-
-    def parse_links(
-        buf: str,
-    ) -> abc.Generator[tuple[str, list[str]], None, None]:
-        r"""Parse links from `buf`.
-
-        Find quoted parts, these are allowed to contain commas
-        however, it is much easier to parse if they do not so
-        replace them with \000.  Since the NUL byte is not allowed
-        to be there, we can replace it with a comma later on.
-        A similar trick is performed on semicolons with \001.
-        """
-        quoted = re.findall('"([^"]*)"', buf)
-        for segment in quoted:
-            left, match, right = buf.partition(segment)
-            match = match.replace(',', '\000')
-            match = match.replace(';', '\001')
-            buf = f'{left}{match}{right}'
-
-        while buf:
-            matched = re.match(r'<(?P<link>[^>]*)>\s*(?P<params>.*)', buf)
-            if matched:
-                groups = matched.groupdict()
-                params, _, buf = groups['params'].partition(',')
-                params = params.replace('\000', ',')  # undo comma hackery
-                if params and not params.startswith(';'):
-                    raise errors.MalformedLinkValue(
-                        'Param list missing opening semicolon'
-                    )
-
-                yield (
-                    groups['link'].strip(),
-                    [
-                        p.replace('\001', ';').strip()
-                        for p in params[1:].split(';')
-                        if p
-                    ],
-                )
-                buf = buf.strip()
-            else:
-                raise errors.MalformedLinkValue('Malformed link header', buf)
-
-    for target, param_list in parse_links(sanitized):
-        parser = _helpers.ParameterParser(strict=strict)
-        for name, value in _parse_parameter_list(
-            param_list, strip_interior_whitespace=True
+    parser = _helpers.ParameterParser(strict=strict)
+    start, length = 0, len(buf)
+    while start < length:
+        target_start = buf.find('<', start)
+        target_end = buf.find('>', target_start)
+        if (
+            target_start < 0
+            or target_end < 0
+            or buf[start:target_start].strip()
         ):
+            raise errors.MalformedLinkValue(
+                'Malformed link header', buf[start:]
+            )
+
+        end = _find_unquoted(buf, ',', target_end + 1)
+        params = buf[target_end + 1 : end].strip()
+        if params and not params.startswith(';'):
+            raise errors.MalformedLinkValue(
+                'Param list missing opening semicolon'
+            )
+
+        parser.reset()
+        for name, value in _iter_link_parameters(params[1:]):
             parser.add_value(name, value)
-
         links.append(
-            datastructures.LinkHeader(target=target, parameters=parser.values)
+            datastructures.LinkHeader(
+                target=buf[target_start + 1 : target_end].strip(),
+                parameters=parser.values,
+            )
         )
+        start = end + 1
 
     return links
 
@@ -372,20 +321,153 @@ def parse_list(value: str) -> list[str]:
     :return: list of header elements as strings
 
     """
-    segments = _QUOTED_SEGMENT_RE.findall(value)
-    for segment in segments:
-        left, match, right = value.partition(segment)
-        value = ''.join([left, match.replace(',', '\000'), right])
-    return [_dequote(x.strip()).replace('\000', ',') for x in value.split(',')]
+    return list(iter_list(value))
 
 
-def _parse_parameter_list(
+def iter_list(value: str) -> abc.Generator[str, None, None]:
+    """Iterate over the elements of a comma-separated list header.
+
+    This is the lazy version of [ietfparse.headers.parse_list][].
+    Elements are stripped and dequoted as they are generated so
+    callers that stop early do not pay for the remainder of the
+    header.
+
+    :param value: header value to split into elements
+    :return: generator of header elements as strings
+
+    """
+    if '"' not in value:
+        for element in value.split(','):
+            yield element.strip()
+        return
+
+    start, length = 0, len(value)
+    while start <= length:
+        end = _find_unquoted(value, ',', start)
+        yield _strip_and_dequote(value[start:end])
+        start = end + 1
+
+
+def _accept_sort_key(
+    header: datastructures.ContentType, rank: int
+) -> tuple[float, int, bool, bool, int, str, str]:
+    """Generate the sort key for a parsed Accept value.
+
+    :param header: the parsed value with its quality set
+    :param rank: tie breaker for values with the same quality;
+        higher ranks sort first
+
+    Sorting by this key in *reverse* order results in the highest
+    quality values first.  Values with the same quality and rank are
+    ordered from most specific to least specific: concrete types
+    before wildcards and more parameters before fewer.  The type
+    names are the final tie breaker.
+
+    """
+    assert header.quality is not None  # appease mypy  # noqa: S101
+    return (
+        header.quality,
+        rank,
+        header.content_type != '*',
+        header.content_subtype != '*',
+        len(header.parameters),
+        header.content_type,
+        header.content_subtype,
+    )
+
+
+def _extract_quality(parameter_str: str) -> str | None:
+    """Find the raw quality value in a parameter string.
+
+    :param parameter_str: the parameters following a list element
+    :return: the unquoted value of the last ``q`` parameter or
+        :data:`None` if `parameter_str` does not contain one
+
+    Only the ``q`` parameter is examined so the other parameters are
+    not parsed at all.
+
+    >>> _extract_quality(' q=0.5')
+    '0.5'
+    >>> _extract_quality('level=1; q = "0.8"')
+    '0.8'
+    >>> _extract_quality('level=1') is None
+    True
+
+    """
+    parameter_str = parameter_str.strip()
+    if not parameter_str:
+        return None
+    if parameter_str.startswith('q=') and ';' not in parameter_str:
+        return _strip_and_dequote(parameter_str[2:])
+
+    quality = None
+    for parameter in parameter_str.split(';'):
+        name, sep, value = parameter.partition('=')
+        if sep and name.strip() == 'q':
+            quality = _strip_and_dequote(value)
+    return quality
+
+
+def _find_unquoted(value: str, delimiter: str, start: int = 0) -> int:
+    """Find the first `delimiter` in `value` that is not quoted.
+
+    :param value: the string to search
+    :param delimiter: the character to search for
+    :param start: index to start searching at
+    :return: the index of the first unquoted `delimiter` at or after
+        `start` or the length of `value` if there is not one
+
+    The search hops between delimiters and quotes using
+    [str.find][] so a quoted string is skipped in a single step.
+    An unterminated quoted string extends to the end of `value`.
+
+    >>> _find_unquoted('one, "two, three", four', ',', 4)
+    17
+
+    """
+    while True:
+        end = value.find(delimiter, start)
+        if end < 0:
+            return len(value)
+        quote = value.find('"', start, end)
+        if quote < 0:
+            return end
+        start = value.find('"', quote + 1) + 1
+        if not start:
+            return len(value)
+
+
+def _iter_link_parameters(
+    parameters: str,
+) -> abc.Generator[tuple[str, str], None, None]:
+    """Split the parameters from a single link value into pairs.
+
+    :param parameters: semicolon-separated parameters
+    :return: a generator of name and value pairs
+
+    Whitespace around the ``=`` is removed and the values are
+    case-folded and dequoted.  [RFC-8288-section-3] allows for
+    parameters without values; they are included with an empty
+    string as the value.
+
+    """
+    start, length = 0, len(parameters)
+    while start < length:
+        end = _find_unquoted(parameters, ';', start)
+        name, _, value = parameters[start:end].partition('=')
+        name = name.strip()
+        if name:
+            yield name, _strip_and_dequote(value.lower())
+        start = end + 1
+
+
+def _iter_parameter_list(
     parameter_list: abc.Iterable[str],
     *,
     normalize_parameter_names: bool = False,
     normalize_parameter_values: bool = True,
     strip_interior_whitespace: bool = False,
-) -> list[tuple[str, str]]:
+) -> abc.Generator[tuple[str, str], None, None]:
     """Parse a named parameter list in the "common" format.
 
     :param parameter_list: sequence of string values to parse
@@ -395,51 +477,223 @@ def _parse_parameter_list(
         as *truthy*, then parameter values are case-folded to lower case
     :keyword strip_interior_whitespace: remove whitespace between
         name and values surrounding the ``=``
-    :return: a sequence containing the name to value pairs
+    :return: a generator of name to value pairs
 
     The parsed values are normalized according to the keyword parameters
-    and returned as :class:`tuple` of name to value pairs preserving the
+    and yielded as :class:`tuple` of name to value pairs preserving the
     ordering from `parameter_list`.  The values will have quotes removed
-    if they were present.
+    if they were present.  Parameters without an ``=`` are skipped
+    since the parameter grammar requires a value.  Callers that only
+    need a :class:`dict` can pass the generator straight to the
+    constructor.
 
     """
-    parameters = []
     for param in parameter_list:
         param = param.strip()  # noqa: PLW2901 -- overridden for simplicity
-        if param:
-            name, value = param.split('=')
+        name, sep, value = param.partition('=')
+        if sep:
             if strip_interior_whitespace:
                 name, value = name.strip(), value.strip()
             if normalize_parameter_names:
                 name = name.lower()
             if normalize_parameter_values:
                 value = value.lower()
-            parameters.append((name, _dequote(value.strip())))
-    return parameters
+            yield name, _strip_and_dequote(value)
+
+
+@functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_accept(
+    header_value: str, *, strict: bool
+) -> tuple[
+    tuple[str, str, tuple[tuple[str, str], ...], str | None, float], ...
+]:
+    """Parse `header_value` into immutable components.
+
+    :return: a tuple containing the type, subtype, parameter pairs,
+        suffix, and quality of each value in decreasing quality order
+
+    This is the cached implementation of `parse_accept`.
+
+    """
+    guard: contextlib.AbstractContextManager[None]
+    if strict:
+        guard = contextlib.nullcontext()
+    else:
+        guard = contextlib.suppress(ValueError)
+
+    headers: list[datastructures.ContentType] = []
+    for content_type in iter_list(header_value):
+        with guard:
+            headers.append(parse_content_type(content_type))
+
+    if len(headers) == 1:  # nothing to rank
+        header = headers[0]
+        q = header.parameters.pop('q', None)
+        return (
+            (
+                header.content_type,
+                header.content_subtype,
+                tuple(header.parameters.items()),
+                header.content_suffix,
+                1.0 if q is None else float(q),
+            ),
+        )
+
+    # explicit q=1.0 values are ranked ahead of implicit ones in the
+    # order that they appear in the header
+    explicit_rank = len(headers)
+    ranked = []
+    for header in headers:
+        rank = 0
+        q = header.parameters.pop('q', None)
+        if q is None:
+            header.quality = 1.0
+        else:
+            header.quality = float(q)
+            if q == '1.0':  # same rule as _parse_qualified_list
+                rank = explicit_rank
+                explicit_rank -= 1
+        ranked.append((_accept_sort_key(header, rank), header))
+
+    ranked.sort(key=itemgetter(0), reverse=True)
+    return tuple(
+        (
+            header.content_type,
+            header.content_subtype,
+            tuple(header.parameters.items()),
+            header.content_suffix,
+            key[0],
+        )
+        for key, header in ranked
+    )
+
+
+@functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_cache_control(
+    header_value: str,
+) -> tuple[tuple[str, str | int | bool | None], ...]:
+    """Parse `header_value` into directive name and value pairs.
 
+    This is the cached implementation of `parse_cache_control`.
 
-def _parse_qualified_list(value: str) -> list[str]:
+    """
+    directives: dict[str, str | int | bool | None] = {}
+
+    for segment in iter_list(header_value):
+        name, sep, value = segment.partition('=')
+        if sep != '=':
+            directives[name] = (
+                True if name in _CACHE_CONTROL_BOOL_DIRECTIVES else None
+            )
+        elif sep and value:
+            value = _strip_and_dequote(value)
+            directives[name] = int(value) if value.isdecimal() else value
+        # NB ``name='' is never valid and is ignored!
+
+    return tuple(directives.items())
+
+
+@functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_content_type(
+    content_type: str, *, normalize_parameter_values: bool
+) -> tuple[str, str, tuple[tuple[str, str], ...], str | None]:
+    """Parse `content_type` into immutable components.
+
+    :return: a tuple of the type, subtype, parameter name to value
+        pairs, and the structured syntax suffix or :data:`None`
+
+    The type, subtype, suffix and parameter names are normalized the
+    same way that [ietfparse.datastructures.ContentType][] normalizes
+    them so the components can be used without further processing.
+
+    This is the cached implementation of `parse_content_type`.
+
+    """
+    if '(' in content_type or ';' in content_type:
+        type_spec, _, parameter_str = _remove_comments(content_type).partition(
+            ';'
+        )
+    else:  # bare type/subtype is by far the most common shape
+        type_spec, parameter_str = content_type, ''
+    type_name, sep, content_subtype = type_spec.lower().partition('/')
+    type_name, content_subtype = type_name.strip(), content_subtype.strip()
+    if not (sep and type_name and content_subtype) or '/' in content_subtype:
+        raise errors.MalformedContentType(content_type)
+
+    parameters: tuple[tuple[str, str], ...] = ()
+    if parameter_str:
+        parameters = tuple(
+            dict(
+                _iter_parameter_list(
+                    parameter_str.split(';'),
+                    normalize_parameter_names=True,
+                    normalize_parameter_values=normalize_parameter_values,
+                )
+            ).items()
+        )
+    subtype_name, plus, content_suffix = content_subtype.rpartition('+')
+    if plus:
+        return (
+            type_name,
+            subtype_name.rstrip(),
+            parameters,
+            content_suffix.lstrip(),
+        )
+    return type_name, content_subtype, parameters, None
+
+
+def _parse_parameter_list(
+    parameter_list: abc.Iterable[str],
+    *,
+    normalize_parameter_names: bool = False,
+    normalize_parameter_values: bool = True,
+    strip_interior_whitespace: bool = False,
+) -> list[tuple[str, str]]:
+    """Parse a named parameter list into a list of pairs.
+
+    This is the eager form of `_iter_parameter_list` for callers
+    that need to traverse the parameters more than once.
+
+    """
+    return list(
+        _iter_parameter_list(
+            parameter_list,
+            normalize_parameter_names=normalize_parameter_names,
+            normalize_parameter_values=normalize_parameter_values,
+            strip_interior_whitespace=strip_interior_whitespace,
+        )
+    )
+
+
+@functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_qualified_list(value: str) -> tuple[str, ...]:
     """Parse `value` as a comma-separated list of qualified names.
 
-    Returns a sorted list of values based upon the quality rules specified
+    Returns a sorted tuple of values based upon the quality rules specified
     in https://tools.ietf.org/html/rfc7231 for the Accept-* headers.
 
     :param value: The value to parse into a list
 
     """
-    found_wildcard = False
+    found_wildcard = explicit_quality = False
     values, rejected_values = [], []
     parsed = parse_list(value)
     default = float(len(parsed) + 1)
     highest = default + 1.0
     for raw_str in parsed:
-        charset, _, parameter_str = raw_str.replace(' ', '').partition(';')
+        charset, _, parameter_str = raw_str.partition(';')
+        charset = charset.strip()
+        if ' ' in charset:  # interior whitespace is discarded
+            charset = charset.replace(' ', '')
         if charset == '*':
             found_wildcard = True
             continue
-        params = dict(_parse_parameter_list(parameter_str.split(';')))
-        actual_param = params.get('q')
-        quality = float(params.pop('q', default))
+        actual_param = _extract_quality(parameter_str)
+        if actual_param is None:
+            quality = default
+        else:
+            explicit_quality = True
+            quality = float(actual_param)
         if quality < _SMALLEST_QUALITY:
             rejected_values.append(charset)
         elif actual_param == '1.0':
@@ -447,34 +701,75 @@ def _parse_qualified_list(value: str) -> list[str]:
         else:
             values.append((quality, charset))
         default -= 1.0
-    parsed = [value[1] for value in sorted(values, reverse=True)]
+    if explicit_quality:  # otherwise values are already in order
+        values.sort(reverse=True)
+    parsed = [value[1] for value in values]
     if found_wildcard:
         parsed.append('*')
     parsed.extend(rejected_values)
-    return parsed
+    return tuple(parsed)
 
 
 def _remove_comments(value: str) -> str:
-    return _COMMENT_RE.sub('', value)
-
+    """Remove comments from `value`.
 
-def _dequote(value: str) -> str:
-    """Remove from value if the entire string is quoted.
+    :param value: value to remove comments from
+    :return: `value` without any comments
 
-    :param value: value to dequote
+    Comments are parenthesized text as described in
+    [RFC-9110-section-5.6.5].  They may be nested and parentheses
+    that appear inside of a quoted string do not start a comment.
+    An unterminated comment extends to the end of `value`.
 
-    :return: a new :class:`str` with leading and trailing quotes
-        removed or `value` if not fully quoted
+    >>> _remove_comments('text/plain (one); charset=utf-8 (two)')
+    'text/plain ; charset=utf-8 '
+    >>> _remove_comments('<>; title="not (a) comment"')
+    '<>; title="not (a) comment"'
 
-    >>> _dequote('"value"')
+    """
+    if '(' not in value:
+        return value
+
+    segments, start, depth, in_quotes = [], 0, 0, False
+    for index, char in enumerate(value):
+        if in_quotes:
+            in_quotes = char != '"'
+        elif char == '"' and not depth:
+            in_quotes = True
+        elif char == '(':
+            if not depth:
+                segments.append(value[start:index])
+            depth += 1
+        elif char == ')' and depth:
+            depth -= 1
+            if not depth:
+                start = index + 1
+    if not depth:
+        segments.append(value[start:])
+    return ''.join(segments)
+
+
+def _strip_and_dequote(value: str) -> str:
+    """Strip surrounding whitespace and then remove quotes from `value`.
+
+    :param value: value to strip and dequote
+
+    :return: the stripped value with leading and trailing quotes
+        removed if it was fully quoted
+
+    >>> _strip_and_dequote(' "value" ')
     'value'
-    >>> _dequote('not="quoted"')
+    >>> _strip_and_dequote('not="quoted"')
     'not="quoted"'
 
-    >>> _dequote('" with spaces "')
+    >>> _strip_and_dequote('" with spaces "')
     ' with spaces '
 
+    >>> _strip_and_dequote('')
+    ''
+
     """
-    if value[0] == '"' and value[-1] == '"':
+    value = value.strip()
+    if len(value) > 1 and value[0] == '"' and value[-1] == '"':
         return value[1:-1]
     return value
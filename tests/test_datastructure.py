@@ -1,4 +1,5 @@
 import unittest
+import weakref
 
 from ietfparse import (
     constants,  # noqa: F401 -- imported for coverage
@@ -27,6 +28,10 @@ class ContentTypeCreationTests(unittest.TestCase):
         )
         self.assertDictEqual({'key': 'Value'}, content_type.parameters)
 
+    def test_that_weak_references_are_supported(self) -> None:
+        content_type = datastructures.ContentType('a', 'b')
+        self.assertIs(weakref.ref(content_type)(), content_type)
+
 
 class ContentTypeStringificationTests(unittest.TestCase):
     def test_that_simple_case_works(self) -> None:
@@ -76,6 +81,14 @@ class ContentTypeComparisonTests(unittest.TestCase):
         )
         self.assertEqual(ct1, ct2)
 
+    def test_that_content_types_are_not_hashable(self) -> None:
+        # instances are mutable and compare equal to strings
+        ct = datastructures.ContentType('text', 'html')
+        with self.assertRaises(TypeError):
+            hash(ct)
+        with self.assertRaises(TypeError):
+            {ct}  # noqa: B018
+
     def test_primary_wildcard_is_less_than_anything_else(self) -> None:
         wildcard = datastructures.ContentType('*', '*')
         text_plain = datastructures.ContentType('text', 'plain')
@@ -120,6 +133,13 @@ class ContentTypeComparisonTests(unittest.TestCase):
         text_plain = datastructures.ContentType('text', 'plain')
         self.assertNotEqual(text_plain, 'text')
 
+    def test_that_equal_types_are_ordered_inclusively(self) -> None:
+        content_type = datastructures.ContentType('text', 'plain')
+        self.assertLessEqual(content_type, 'text/plain')
+        self.assertGreaterEqual(content_type, 'text/plain')
+        self.assertFalse(content_type < 'text/plain')
+        self.assertFalse(content_type > 'text/plain')
+
     def test_comparing_non_content_type_instances(self) -> None:
         ct = datastructures.ContentType('application', 'binary')
         obj = object()
@@ -24,6 +24,11 @@ class CacheControlParsingTests(unittest.TestCase):
         self.assertEqual(100, parsed['max-age'])
         self.assertEqual(20, parsed['min-fresh'])
 
+    def test_that_signed_numbers_are_not_delta_seconds(self) -> None:
+        parsed = headers.parse_cache_control('max-age=-1, x-offset=+5')
+        self.assertEqual('-1', parsed['max-age'])
+        self.assertEqual('+5', parsed['x-offset'])
+
     def test_that_string_parameters_are_parsed(self) -> None:
         parsed = headers.parse_cache_control(
             'community="UCI", x-token=" foo bar "'
@@ -34,3 +39,11 @@ class CacheControlParsingTests(unittest.TestCase):
     def test_that_empty_parameter_values_are_ignored(self) -> None:
         parsed = headers.parse_cache_control('x-should-be-ignored=')
         self.assertNotIn('x-should-be-ignored', parsed)
+
+    def test_that_results_are_not_shared(self) -> None:
+        first = headers.parse_cache_control('max-age=10, public')
+        first['max-age'] = 20
+        self.assertEqual(
+            headers.parse_cache_control('max-age=10, public'),
+            {'max-age': 10, 'public': True},
+        )
@@ -47,11 +47,76 @@ class ParsingComplexContentTypeTests(unittest.TestCase):
         self.assertEqual(self.parsed.parameters['msgtype'], 'Request')
 
 
+class ContentTypeSuffixTests(unittest.TestCase):
+    def test_that_suffix_follows_the_last_plus_sign(self) -> None:
+        parsed = headers.parse_content_type('application/vnd.a+b+json')
+        self.assertEqual(parsed.content_subtype, 'vnd.a+b')
+        self.assertEqual(parsed.content_suffix, 'json')
+
+
+class ContentTypeCommentTests(unittest.TestCase):
+    def test_that_parameters_between_comments_are_retained(self) -> None:
+        parsed = headers.parse_content_type(
+            'text/plain (one); charset=utf-8 (two)'
+        )
+        self.assertEqual(parsed.parameters, {'charset': 'utf-8'})
+
+    def test_that_nested_comments_are_removed(self) -> None:
+        parsed = headers.parse_content_type(
+            'text/plain (outer (inner) comment); format=flowed'
+        )
+        self.assertEqual(parsed, 'text/plain; format=flowed')
+
+
+class ContentTypeCachingTests(unittest.TestCase):
+    def test_that_results_are_not_shared(self) -> None:
+        first = headers.parse_content_type('text/plain; charset=utf-8')
+        first.parameters['charset'] = 'latin1'
+        first.content_subtype = 'html'
+
+        second = headers.parse_content_type('text/plain; charset=utf-8')
+        self.assertIsNot(first, second)
+        self.assertEqual(second, 'text/plain; charset=utf-8')
+
+    def test_that_normalization_is_part_of_the_cache_key(self) -> None:
+        value = 'text/plain; charset=UTF-8'
+        self.assertEqual(
+            headers.parse_content_type(value).parameters['charset'],
+            'utf-8',
+        )
+        self.assertEqual(
+            headers.parse_content_type(
+                value, normalize_parameter_values=False
+            ).parameters['charset'],
+            'UTF-8',
+        )
+
+
 class ParsingBrokenContentTypes(unittest.TestCase):
     def test_that_missing_subtype_raises_value_error(self) -> None:
         with self.assertRaises(errors.MalformedContentType):
             headers.parse_content_type('*')
 
+    def test_that_empty_type_or_subtype_raises_error(self) -> None:
+        for value in ('text/', '/plain', '/', ' / ; charset=utf-8'):
+            with self.assertRaises(errors.MalformedContentType):
+                headers.parse_content_type(value)
+
+    def test_that_extra_slashes_raise_error(self) -> None:
+        with self.assertRaises(errors.MalformedContentType):
+            headers.parse_content_type('application/vnd.x/y')
+
+    def test_that_parameters_without_values_are_ignored(self) -> None:
+        parsed = headers.parse_content_type('text/plain; charset')
+        self.assertEqual(parsed.parameters, {})
+
+    def test_that_parameter_values_can_contain_equals(self) -> None:
+        parsed = headers.parse_content_type(
+            'application/octet-stream; token="YWJj=="',
+            normalize_parameter_values=False,
+        )
+        self.assertEqual(parsed.parameters, {'token': 'YWJj=='})
+
 
 class Rfc7231ExampleTests(unittest.TestCase):
     """Test cases from RFC7231, Section 3.1.1.1"""
@@ -49,3 +49,15 @@ class ForwardedHeaderParsingTests(unittest.TestCase):
             )
         self.assertEqual(context.exception.header_name, 'Forwarded')
         self.assertEqual(context.exception.header_value, 'for=127.0.0.1;one=2')
+
+    def test_that_valueless_parameters_are_ignored(self) -> None:
+        parsed = headers.parse_forwarded('for=1.2.3.4;secret, bogus')
+        self.assertEqual(parsed, [{'for': '1.2.3.4'}])
+
+    def test_that_valueless_parameters_can_be_prohibited(self) -> None:
+        with self.assertRaises(errors.StrictHeaderParsingFailure) as context:
+            headers.parse_forwarded(
+                'for=1.2.3.4;secret', only_standard_parameters=True
+            )
+        self.assertEqual(context.exception.header_name, 'Forwarded')
+        self.assertEqual(context.exception.header_value, 'for=1.2.3.4;secret')
@@ -1,6 +1,7 @@
 import contextlib
 import typing
 import unittest
+import weakref
 from collections import abc
 
 from ietfparse import datastructures, errors, headers
@@ -51,6 +52,22 @@ class LinkHeaderParsingTests(unittest.TestCase):
             parsed[0].parameters, [('rel', 'quoted; with semicolon')]
         )
 
+    def test_that_quoted_parameters_can_contain_equals(self) -> None:
+        parsed = headers.parse_link('<>; anchor="#a=b"; rel=next')
+        self.assertEqual(
+            parsed[0].parameters, [('anchor', '#a=b'), ('rel', 'next')]
+        )
+
+    def test_that_parameters_without_values_are_parsed(self) -> None:
+        parsed = headers.parse_link('<>; crossorigin; rel=preload')
+        self.assertEqual(
+            parsed[0].parameters, [('crossorigin', ''), ('rel', 'preload')]
+        )
+
+    def test_that_quoted_parameters_can_contain_parentheses(self) -> None:
+        parsed = headers.parse_link('<>; title="a (b) c" (comment)')
+        self.assertEqual(parsed[0].parameters, [('title', 'a (b) c')])
+
     def test_that_title_star_overrides_title_parameter(self) -> None:
         parsed = headers.parse_link('<>; title=title; title*=title*')
         self.assertEqual(
@@ -100,6 +117,11 @@ class MalformedLinkHeaderTests(unittest.TestCase):
         with self.assertRaises(errors.MalformedLinkValue):
             headers.parse_link('https://example.com; rel=wrong')
 
+    def test_that_whitespace_only_value_is_rejected(self) -> None:
+        with self.assertRaises(errors.MalformedLinkValue):
+            headers.parse_link('  ')
+        self.assertEqual(headers.parse_link(''), [])
+
     def test_that_first_semicolon_is_required(self) -> None:
         with self.assertRaises(errors.MalformedLinkValue):
             headers.parse_link('<https://example.com> rel="still wrong"')
@@ -209,6 +231,17 @@ class ImmutableSequenceTests(unittest.TestCase):
         for a, b in zip(seq, imm_seq):
             self.assertEqual(a, b)
 
+    def test_that_immutable_sequences_compare_by_value(self) -> None:
+        imm_seq = datastructures.ImmutableSequence[str](['one', 'two'])
+        self.assertEqual(
+            imm_seq, datastructures.ImmutableSequence[str](['one', 'two'])
+        )
+        self.assertEqual(imm_seq, ('one', 'two'))
+        self.assertNotEqual(imm_seq, ['one'])
+        self.assertNotEqual(
+            imm_seq, datastructures.ImmutableSequence[str](['two', 'one'])
+        )
+
     def test_modifying_target(self) -> None:
         parsed = headers.parse_link('<>; values=one; values=two')
         self.assertEqual(len(parsed), 1)
@@ -244,6 +277,18 @@ class ImmutableSequenceTests(unittest.TestCase):
         with self.assert_raises_one_of(AttributeError, TypeError):
             params += ['value']
 
+    def test_indexed_results_are_reused(self) -> None:
+        parsed = headers.parse_link('<>; param=one; param=two')
+        link = parsed[0]
+        self.assertIs(link['param'], link['param'])
+        self.assertEqual(link['param'], ['one', 'two'])
+        self.assertEqual(link['non-existent'], [])
+
+    def test_that_weak_references_are_supported(self) -> None:
+        link = headers.parse_link('<>; param=one')[0]
+        self.assertIs(weakref.ref(link)(), link)
+        self.assertIs(weakref.ref(link['param'])(), link['param'])
+
     def test_sequence_expectations(self) -> None:
         parsed = headers.parse_link('<>; param=one; param=two')
         self.assertEqual(len(parsed), 1)
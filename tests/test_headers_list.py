@@ -26,3 +26,30 @@ class ListHeaderParsingTests(unittest.TestCase):
             headers.parse_list('max-age=5, x-foo="prune"'),
             ['max-age=5', 'x-foo="prune"'],
         )
+
+    def test_that_quoted_segments_are_found_in_place(self) -> None:
+        self.assertEqual(headers.parse_list('a,b, "a,b"'), ['a', 'b', 'a,b'])
+
+    def test_that_repeated_quoted_segments_are_kept(self) -> None:
+        self.assertEqual(
+            headers.parse_list('"x,y", z, "x,y"'), ['x,y', 'z', 'x,y']
+        )
+
+    def test_that_empty_elements_are_retained(self) -> None:
+        self.assertEqual(
+            headers.parse_list('one,, two,""'), ['one', '', 'two', '']
+        )
+
+
+class IterListTests(unittest.TestCase):
+    def test_that_elements_are_generated_lazily(self) -> None:
+        elements = headers.iter_list('one, "two, three", four')
+        self.assertEqual(next(elements), 'one')
+        self.assertEqual(next(elements), 'two, three')
+        self.assertEqual(list(elements), ['four'])
+
+    def test_that_result_matches_parse_list(self) -> None:
+        value = 'max-age=5, x-foo="prune", "comma ->,<- here"'
+        self.assertEqual(
+            list(headers.iter_list(value)), headers.parse_list(value)
+        )
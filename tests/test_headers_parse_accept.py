@@ -58,6 +58,40 @@ class ParseAcceptHeaderTests(unittest.TestCase):
         )
         self.assertEqual(parsed[3], datastructures.ContentType('*', '*'))
 
+    def test_that_ordering_does_not_depend_on_input_order(self) -> None:
+        expected = [
+            datastructures.ContentType('audio', 'basic'),
+            datastructures.ContentType('image', '*'),
+        ]
+        self.assertEqual(
+            headers.parse_accept('image/*, audio/basic'), expected
+        )
+        self.assertEqual(
+            headers.parse_accept('audio/basic, image/*'), expected
+        )
+
+    def test_that_explicit_highest_quality_values_are_first(self) -> None:
+        parsed = headers.parse_accept(
+            'text/*, application/json;q=1.0, text/html;q=1.0, */*;q=0.5'
+        )
+        self.assertEqual(
+            [str(value) for value in parsed],
+            ['application/json', 'text/html', 'text/*', '*/*'],
+        )
+        self.assertEqual(
+            [value.quality for value in parsed], [1.0, 1.0, 1.0, 0.5]
+        )
+
+    def test_that_only_literal_highest_quality_is_explicit(self) -> None:
+        parsed = headers.parse_accept(
+            'text/html, application/json;q=1, text/plain;q=1.0'
+        )
+        self.assertEqual(
+            [str(value) for value in parsed],
+            ['text/plain', 'text/html', 'application/json'],
+        )
+        self.assertEqual([value.quality for value in parsed], [1.0, 1.0, 1.0])
+
     def test_that_extension_tokens_are_parsed(self) -> None:
         self.assertEqual(
             headers.parse_accept('application/json;charset="utf-8"'),
@@ -99,10 +133,27 @@ class ParseAcceptHeaderTests(unittest.TestCase):
                 strict=True,
             )
 
+    def test_that_single_value_quality_is_parsed(self) -> None:
+        parsed = headers.parse_accept('text/html;level=1;q=0.5')
+        self.assertEqual(len(parsed), 1)
+        self.assertEqual(parsed[0], 'text/html; level=1')
+        self.assertEqual(parsed[0].quality, 0.5)
+
     def test_the_invalid_header_returns_empty_list(self) -> None:
         parsed = headers.parse_accept('*')
         self.assertEqual(len(parsed), 0)
 
+    def test_that_results_are_not_shared(self) -> None:
+        first = headers.parse_accept('text/html;level=1, text/*;q=0.5')
+        first[0].parameters.clear()
+        first.reverse()
+
+        second = headers.parse_accept('text/html;level=1, text/*;q=0.5')
+        self.assertEqual(second[0], 'text/html; level=1')
+        self.assertEqual(second[0].quality, 1.0)
+        self.assertEqual(second[1], 'text/*')
+        self.assertEqual(second[1].quality, 0.5)
+
 
 class ParseAcceptCharsetHeaderTests(unittest.TestCase):
     # Final example in https://tools.ietf.org/html/rfc7231#section-5.3.3
@@ -204,6 +255,13 @@ class ParseAcceptLanguageTests(unittest.TestCase):
             ['aa', '*', 'bb'],
         )
 
+    def test_that_results_are_not_shared(self) -> None:
+        first = headers.parse_accept_language('en;q=0.5, de')
+        first.append('fr')
+        self.assertEqual(
+            headers.parse_accept_language('en;q=0.5, de'), ['de', 'en']
+        )
+
     def test_that_order_is_retained_without_quality(self) -> None:
         self.assertEqual(
             headers.parse_accept_language(
@@ -227,3 +285,21 @@ class ParseAcceptLanguageTests(unittest.TestCase):
             ),
             ['de-Latf-DE', 'de-Latn-DE-1996', 'de-Latn-DE'],
         )
+
+    def test_that_only_literal_highest_quality_is_explicit(self) -> None:
+        self.assertEqual(
+            headers.parse_accept_language('en, fr;q=1, de;q=1.0'),
+            ['de', 'en', 'fr'],
+        )
+
+    def test_that_whitespace_around_quality_is_ignored(self) -> None:
+        self.assertEqual(
+            headers.parse_accept_language('en ; q = 0.5 , de ;q=0.7'),
+            ['de', 'en'],
+        )
+
+    def test_that_whitespace_inside_values_is_removed(self) -> None:
+        self.assertEqual(
+            headers.parse_accept_language('en - US, de ;q=0.7'),
+            ['en-US', 'de'],
+        )
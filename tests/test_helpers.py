@@ -36,3 +36,26 @@ class ParseHeaderTests(unittest.TestCase):
     def test_invalid_value_returns_original(self) -> None:
         result = _helpers.parse_header('parse_content_type', 'invalid value')
         self.assertEqual(result, 'invalid value')
+
+
+class ParameterParserTests(unittest.TestCase):
+    def test_that_reset_discards_parsed_values(self) -> None:
+        parser = _helpers.ParameterParser(strict=True)
+        parser.add_value('rel', 'first')
+        parser.add_value('title', 'first')
+        values = parser.values  # noqa: PD011 -- not a DataFrame
+
+        parser.reset()
+        self.assertEqual(parser.values, ())
+        parser.add_value('rel', 'second')
+        self.assertEqual(parser.values, (('rel', 'second'),))
+        self.assertEqual(values, (('rel', 'first'), ('title', 'first')))
+
+    def test_that_values_are_rebuilt_after_adding(self) -> None:
+        parser = _helpers.ParameterParser(strict=True)
+        parser.add_value('title', 'first')
+        self.assertIs(parser.values, parser.values)
+        parser.add_value('title*', 'preferred')
+        self.assertEqual(
+            parser.values, (('title*', 'preferred'), ('title', 'preferred'))
+        )